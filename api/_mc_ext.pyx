@@ -0,0 +1,132 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# =============================================================================
+# _mc_ext.pyx — Ahead-of-time compiled Monte Carlo kernel (optional)
+#
+# Same job as simulation_kernel.py's numba kernel, compiled once at build time
+# instead of JIT-compiled per process: an OpenMP loop over simulations, each
+# drawing, comparing, and accumulating in registers with no intermediate
+# matrix.
+#
+# RANDOM NUMBERS:
+#   Every simulation gets its own xoshiro256+ stream, seeded from four
+#   consecutive splitmix64 outputs at position (seed, i). Streams depend only
+#   on (seed, i), never on which thread ran them, so a given seed reproduces
+#   the same outcomes at any thread count.
+#
+# WHY LANES:
+#   One simulation is a serial chain — each draw needs the previous RNG state
+#   and each add the previous total. _run_lanes() steps _LANES independent
+#   simulations side by side so the compiler can overlap (and vectorize)
+#   them. The win test is done on integers: a 53-bit draw k is below p
+#   exactly when k < ceil(p × 2^53), so there is no int→float conversion.
+#
+# BUILD (optional — simulation_kernel.py falls back without it):
+#   cd api && pip install cython && python build_ext.py build_ext --inplace
+# =============================================================================
+
+import numpy as np
+
+from cython.parallel import prange
+from libc.math cimport ceil
+from libc.stdint cimport int64_t, uint64_t
+
+cimport openmp
+
+# splitmix64 increment (2^64 / golden ratio)
+cdef uint64_t _GAMMA = 0x9E3779B97F4A7C15ULL
+
+# Simulations stepped together by one thread (see WHY LANES)
+cdef enum:
+    _LANES = 8
+
+
+cdef inline uint64_t _splitmix64(uint64_t z) noexcept nogil:
+    """splitmix64 output mix for counter value z."""
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL
+    return z ^ (z >> 31)
+
+
+cdef void _run_lanes(
+    const double* amounts,
+    const int64_t* thresholds,
+    Py_ssize_t n_deals,
+    uint64_t seed,
+    Py_ssize_t first,
+    double* out,
+) noexcept nogil:
+    """Simulations first .. first+_LANES-1 into out."""
+    cdef uint64_t s0[_LANES]
+    cdef uint64_t s1[_LANES]
+    cdef uint64_t s2[_LANES]
+    cdef uint64_t s3[_LANES]
+    cdef double acc[_LANES]
+    cdef uint64_t base, draw, t
+    cdef double amount
+    cdef int64_t threshold
+    cdef Py_ssize_t j, k
+
+    for k in range(_LANES):
+        base = seed + <uint64_t>(4 * (first + k)) * _GAMMA
+        s0[k] = _splitmix64(base + _GAMMA)
+        s1[k] = _splitmix64(base + 2 * _GAMMA)
+        s2[k] = _splitmix64(base + 3 * _GAMMA)
+        s3[k] = _splitmix64(base + 4 * _GAMMA)
+        acc[k] = 0.0
+
+    for j in range(n_deals):
+        amount = amounts[j]
+        threshold = thresholds[j]
+        for k in range(_LANES):
+            # xoshiro256+ step; the top 53 bits are the uniform draw
+            draw = s0[k] + s3[k]
+            t = s1[k] << 17
+            s2[k] ^= s0[k]
+            s3[k] ^= s1[k]
+            s1[k] ^= s2[k]
+            s0[k] ^= s3[k]
+            s2[k] ^= t
+            s3[k] = (s3[k] << 45) | (s3[k] >> 19)
+            # Select, not branch: the outcome is a coin flip no predictor can
+            # learn, and a select lets the compiler vectorize across lanes
+            acc[k] += amount if <int64_t>(draw >> 11) < threshold else 0.0
+
+    for k in range(_LANES):
+        out[first + k] = acc[k]
+
+
+def max_threads() -> int:
+    """Threads OpenMP will use for mc_inner (OMP_NUM_THREADS, else one per core)."""
+    return openmp.omp_get_max_threads()
+
+
+def mc_inner(
+    const double[::1] amounts,
+    const double[::1] probabilities,
+    Py_ssize_t num_simulations,
+    uint64_t seed,
+):
+    """Revenue total for each of num_simulations runs (float64 array)."""
+    cdef Py_ssize_t n_deals = amounts.shape[0]
+    cdef Py_ssize_t j, block
+    cdef Py_ssize_t num_blocks = (num_simulations + _LANES - 1) // _LANES
+
+    if n_deals == 0 or num_simulations == 0:
+        return np.zeros(num_simulations)
+
+    # ceil(p × 2^53): exact, since scaling by a power of two is exact
+    thresholds = np.empty(n_deals, dtype=np.int64)
+    cdef int64_t[::1] thresholds_view = thresholds
+    for j in range(n_deals):
+        thresholds_view[j] = <int64_t>ceil(probabilities[j] * 9007199254740992.0)
+
+    # Padded to whole blocks; the extra lanes are computed and sliced off
+    out = np.empty(num_blocks * _LANES)
+    cdef double[::1] out_view = out
+
+    for block in prange(num_blocks, nogil=True, schedule="static"):
+        _run_lanes(
+            &amounts[0], &thresholds_view[0], n_deals, seed,
+            block * _LANES, &out_view[0],
+        )
+    return out[:num_simulations]
@@ -0,0 +1,32 @@
+# =============================================================================
+# build_ext.py — Build the optional compiled kernel (_mc_ext.pyx)
+#
+# USAGE (from api/):
+#   pip install cython
+#   python build_ext.py build_ext --inplace
+#
+# Builds with -O3 and OpenMP. OpenMP is required — _mc_ext.pyx cimports it —
+# so the compiler must support it: gcc does; macOS clang needs libomp first.
+#
+# For a machine-specific build (only when the image runs on the same CPU
+# family it was built on), add native tuning:
+#   CFLAGS="-march=native" python build_ext.py build_ext --inplace
+#
+# Nothing imports this file at runtime; without the built extension,
+# simulation_kernel.py falls back to numba or pure NumPy.
+# =============================================================================
+
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+setup(
+    name="mc-ext",
+    ext_modules=cythonize(
+        Extension(
+            "_mc_ext",
+            ["_mc_ext.pyx"],
+            extra_compile_args=["-O3", "-fopenmp"],
+            extra_link_args=["-fopenmp"],
+        ),
+    ),
+)
@@ -11,8 +11,11 @@
 # environments — just set ENV VARS.
 # =============================================================================
 
+import os
+from functools import lru_cache
+from typing import Tuple
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
 
 
 class Settings(BaseSettings):
@@ -32,26 +35,32 @@ class Settings(BaseSettings):
     # ── Revenue targets to analyze by default (in USD) ───────────────────────
     # These are the thresholds the agent will report hit-probabilities for.
     # Tune these for your customer's actual pipeline targets.
-    default_revenue_targets: List[float] = [
+    # Tuples, not lists: immutable (no defensive copies) and hashable.
+    default_revenue_targets: Tuple[float, ...] = (
         1_000_000,
         5_000_000,
         10_000_000,
         25_000_000,
         50_000_000,
-    ]
+    )
 
     # ── CORS — which origins can call this API ────────────────────────────────
     # Salesforce's Named Credential callout comes from Salesforce servers, not
     # a browser, so CORS doesn't technically apply to those. But we need CORS
     # open for the Postman / browser testing during setup. Restrict to your
     # org's My Domain in production.
-    allowed_origins: List[str] = [
-        "https://*.salesforce.com",
-        "https://*.force.com",
-        "https://*.lightning.force.com",
+    #
+    # Off by default: the middleware is only installed when DEBUG or
+    # ENABLE_CORS is true (see main.py).
+    enable_cors: bool = False
+
+    # Exact origins only — Starlette compares these literally, so wildcards
+    # never match. Salesforce domains (*.salesforce.com, *.force.com,
+    # *.lightning.force.com) are matched by the regex in main.py.
+    allowed_origins: Tuple[str, ...] = (
         "http://localhost:3000",
         "http://localhost:8080",
-    ]
+    )
 
     # ── API metadata ──────────────────────────────────────────────────────────
     api_title: str = "Monte Carlo Revenue Forecast API"
@@ -61,8 +70,21 @@ class Settings(BaseSettings):
         "Designed to be called from an Agentforce Agent Action via Named Credential."
     )
 
-    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
+    # SKIP_DOTENV=1 skips the .env file read entirely — for Lambda/container
+    # deploys where config only comes from real env vars and .env is absent.
+    # Unknown keys in .env (e.g. API_KEY from .env.example) are ignored.
+    model_config = SettingsConfigDict(
+        env_file=None if os.environ.get("SKIP_DOTENV") == "1" else ".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build Settings once per process — env vars and .env are only read on first call."""
+    return Settings()
 
 
 # Module-level singleton — import this everywhere instead of re-instantiating
-settings = Settings()
+settings = get_settings()
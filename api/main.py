@@ -16,43 +16,107 @@
 #   uses to understand the API shape during External Service registration.
 # =============================================================================
 
-import json
-from datetime import datetime, timezone
-from typing import Any, Dict
+import hashlib
+import re
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+import orjson  # import-time only: pre-serializes the static /health and schema bodies
 
 from config import settings
-from models import HealthResponse, SimulationRequest, SimulationResponse
-from simulation import run_full_simulation
+from pydantic import ValidationError
+
+from models import (
+    API_MODELS,
+    SIMULATION_REQUEST_ADAPTER,
+    HealthResponse,
+    SimulationRequest,
+    SimulationResponse,
+)
+
+# NOTE: `simulation` (and with it NumPy) is not imported here. A running
+# server loads it in the startup lifespan below; anything that only imports
+# the app (tests, tooling, Lambda with lifespan="off") never touches NumPy
+# unless it calls /simulate, which imports it lazily in _run_simulation().
+
+
+# ─── Startup / Shutdown ───────────────────────────────────────────────────────
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Build the deferred Pydantic validators once the worker starts, so module
+    import stays cheap and the first real request doesn't pay for schema build.
+
+    Also loads the simulation engine (NumPy) and warms its random generator,
+    so the first /simulate doesn't pay for either.
+    """
+    for model in API_MODELS:
+        model.model_rebuild()
+    SIMULATION_REQUEST_ADAPTER.rebuild()
+
+    import simulation
+    simulation.warm_up()
+    yield
+
 
 # ─── App Initialization ───────────────────────────────────────────────────────
 
 app = FastAPI(
+    lifespan=lifespan,
     title=settings.api_title,
     version=settings.api_version,
     description=settings.api_description,
-    # These docs URLs are great for demo/dev but should be disabled in prod
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
+    # FastAPI's built-in docs are for local dev only (DEBUG=true). In prod they
+    # would make FastAPI walk every route model to build a 3.1 schema nobody
+    # uses — Salesforce registers against the hand-crafted /api/v1/schema.
+    docs_url="/docs" if settings.debug else None,
+    redoc_url="/redoc" if settings.debug else None,
+    openapi_url="/openapi.json" if settings.debug else None,
 )
 
 # ─── CORS Middleware ───────────────────────────────────────────────────────────
 # Allows Salesforce Setup UI and Postman to call this during configuration.
 # Named Credential callouts from Salesforce servers bypass CORS, but browser-
 # based calls (e.g., from Setup → External Services → Test) need this.
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.allowed_origins,
-    allow_origin_regex=r"https://.*\.(salesforce|force|lightning\.force)\.com",
+#
+# Production traffic is server-to-server, so the middleware is only installed
+# when DEBUG=true or ENABLE_CORS=true — otherwise every request would run it
+# for nothing.
+#
+# Starlette compares allow_origins literally, so wildcard entries like
+# "https://*.salesforce.com" never match anything. Only exact origins go in the
+# list; every Salesforce domain is matched by the one compiled, anchored regex
+# below. It requires at least one subdomain label, so neither
+# "https://evil.com/fake.salesforce.com" nor a bare "https://salesforce.com"
+# gets through.
+SALESFORCE_ORIGIN_RE = re.compile(r"^https://([a-z0-9-]+\.)+(salesforce|force|lightning\.force)\.com$")
+
+
+class SalesforceCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware with one exact-origin lookup plus one precompiled regex match."""
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if self.allow_all_origins or origin in self.allow_origins:
+            return True
+        return SALESFORCE_ORIGIN_RE.match(origin) is not None
+
+
+CORS_OPTIONS: Dict[str, Any] = dict(
+    allow_origins=frozenset(settings.allowed_origins),
     allow_credentials=False,
     allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["Content-Type", "Authorization", "X-Salesforce-Org-Id"],
 )
 
+if settings.debug or settings.enable_cors:
+    app.add_middleware(SalesforceCORSMiddleware, **CORS_OPTIONS)
+
 
 # ─── Global Error Handler ──────────────────────────────────────────────────────
 @app.exception_handler(Exception)
@@ -72,6 +136,8 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
 
 
 # ─── Health Check ─────────────────────────────────────────────────────────────
+_HEALTH_BYTES = orjson.dumps({"status": "ok", "version": settings.api_version})
+
 @app.get(
     "/health",
     response_model=HealthResponse,
@@ -79,12 +145,10 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
     description="Returns 200 OK when the service is running. Used by load balancers and Salesforce Named Credential connectivity tests.",
     tags=["Operations"],
 )
-async def health_check() -> HealthResponse:
-    return HealthResponse(
-        status="ok",
-        version=settings.api_version,
-        timestamp=datetime.now(timezone.utc),
-    )
+async def health_check() -> Response:
+    # The body never changes, so it's serialized once (see _HEALTH_BYTES) —
+    # no model validation or clock read per load-balancer probe.
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 # ─── OpenAPI Schema Endpoint ───────────────────────────────────────────────────
@@ -97,9 +161,8 @@ async def health_check() -> HealthResponse:
         "Note: Returns OpenAPI 3.0 (not 3.1) for Salesforce compatibility."
     ),
     tags=["Operations"],
-    response_class=JSONResponse,
 )
-async def get_schema() -> Dict[str, Any]:
+async def get_schema(request: Request) -> Response:
     """
     Serves the OpenAPI schema in a format compatible with Salesforce External Services.
 
@@ -108,15 +171,58 @@ async def get_schema() -> Dict[str, Any]:
 
     During External Service registration in Salesforce Setup:
       Setup → Integrations → External Services → New → Enter this URL
+
+    The schema only depends on settings, so it is serialized once at import
+    (see _SCHEMA_BYTES below) and served as-is on every request, with an ETag
+    so repeat fetches can be answered with an empty 304.
     """
-    schema = build_openapi_30_schema()
-    return JSONResponse(content=schema)
+    if _etag_matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=_SCHEMA_HEADERS)
+    return Response(content=_SCHEMA_BYTES, media_type="application/json", headers=_SCHEMA_HEADERS)
+
+
+def _etag_matches(if_none_match: Optional[str]) -> bool:
+    """
+    If-None-Match against the schema's ETag, with RFC 9110's weak comparison:
+    "*" matches, and W/"…" matches the same tag (proxies weaken ETags when
+    they gzip).
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == _SCHEMA_ETAG:
+            return True
+    return False
 
 
 # ─── Monte Carlo Simulation Endpoint ──────────────────────────────────────────
+def _inline_refs(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """A pydantic JSON schema with its $defs references inlined."""
+    defs = schema.pop("$defs", {})
+
+    def resolve(node: Any) -> Any:
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return resolve(defs[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+
+    return resolve(schema)
+
+
+# No response_model: run_full_simulation() already returns a validated
+# SimulationResponse, so FastAPI re-validating it would be wasted work. The
+# model is still listed under `responses` for the DEBUG-only /docs page.
+#
+# The handler reads the raw body, so FastAPI can't infer the request schema;
+# it's attached by hand for /docs. Only built with DEBUG=true — building it
+# would defeat the models' defer_build on production cold starts.
 @app.post(
     "/api/v1/simulate",
-    response_model=SimulationResponse,
+    responses={200: {"model": SimulationResponse}},
     summary="Run Monte Carlo Revenue Forecast",
     description=(
         "Accepts a list of Salesforce Opportunities and runs a Monte Carlo simulation "
@@ -125,23 +231,64 @@ async def get_schema() -> Dict[str, Any]:
         "Called by the MonteCarloActionHandler Apex class via Named Credential."
     ),
     tags=["Simulation"],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": _inline_refs(SimulationRequest.model_json_schema())}
+            },
+        }
+    } if settings.debug else None,
 )
-async def simulate(request: SimulationRequest) -> SimulationResponse:
+async def simulate(request: Request) -> Response:
     """
     Primary endpoint: runs the simulation and returns forecast results.
 
     The Apex handler posts to this endpoint with opportunity data queried from
     the Salesforce org. This service runs the math and returns structured results
     that the Agentforce Agent formats into a conversational response.
+
+    The body is read raw and validated straight from bytes by a prebuilt
+    TypeAdapter (pydantic-core parses the JSON itself), skipping FastAPI's
+    body-parsing dependency. Errors still come back as FastAPI-style 422s.
+
+    Reading the body needs `await`, so the handler stays async, but the
+    simulation itself is CPU-bound NumPy work and runs in the threadpool —
+    on the event loop it would stall every other request (health checks
+    included) for its whole duration.
     """
+    try:
+        payload = SIMULATION_REQUEST_ADAPTER.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError([_body_error(err) for err in e.errors(include_url=False)])
+    return await run_in_threadpool(_run_simulation, payload)
+
+
+def _body_error(err: Dict[str, Any]) -> Dict[str, Any]:
+    """A pydantic error, located under "body" the way FastAPI reports it."""
+    err = {**err, "loc": ("body", *err["loc"])}
+    if err["type"] == "json_invalid":
+        # The input here is the whole raw body — don't echo it back
+        err.pop("input", None)
+    return err
+
+
+def _run_simulation(payload: SimulationRequest) -> Response:
+    # Lazy import — only the first call pays for it; after that it's a
+    # sys.modules lookup.
+    from simulation import run_full_simulation
+
     try:
         result = run_full_simulation(
-            opportunities=request.opportunities,
-            num_simulations=request.num_simulations,
-            time_horizon_days=request.time_horizon_days,
-            revenue_targets=request.revenue_targets,
+            opportunities=payload.opportunities,
+            num_simulations=payload.num_simulations,
+            time_horizon_days=payload.time_horizon_days,
+            revenue_targets=payload.revenue_targets,
         )
-        return result
+        # One pydantic-core pass straight to JSON bytes. This also keeps the
+        # wire format the Apex handlers parse — e.g. timestamps end in "Z",
+        # where orjson would write "+00:00".
+        return Response(result.model_dump_json(), media_type="application/json")
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
     except MemoryError:
@@ -153,6 +300,7 @@ async def simulate(request: SimulationRequest) -> SimulationResponse:
 
 # ─── OpenAPI 3.0 Schema Builder ───────────────────────────────────────────────
 
+@lru_cache(maxsize=1)
 def build_openapi_30_schema() -> Dict[str, Any]:
     """
     Hand-crafted OpenAPI 3.0 schema for Salesforce External Services compatibility.
@@ -161,6 +309,9 @@ def build_openapi_30_schema() -> Dict[str, Any]:
     and Salesforce External Services (as of Winter '25) only supports 3.0. The key
     differences are: nullable fields use `nullable: true` instead of anyOf+null,
     and the info structure is slightly different.
+
+    Cached: settings are fixed for the life of the process, so the dict is
+    built once. Treat the returned dict as read-only.
     """
     return {
         "openapi": "3.0.3",
@@ -242,7 +393,7 @@ def build_openapi_30_schema() -> Dict[str, Any]:
                     "required": ["name", "amount", "probability", "close_date"],
                     "properties": {
                         "name": {"type": "string", "description": "Opportunity name or identifier."},
-                        "amount": {"type": "number", "format": "double", "description": "Deal value in USD. Must be > 0."},
+                        "amount": {"type": "number", "format": "double", "minimum": 0.0, "exclusiveMinimum": True, "maximum": 10000000000, "description": "Deal value in USD. Must be > 0 and <= 10B."},
                         "probability": {"type": "number", "format": "double", "minimum": 0.0, "maximum": 1.0, "description": "Win probability (0.0 to 1.0)."},
                         "close_date": {"type": "string", "format": "date", "description": "Expected close date (YYYY-MM-DD)."},
                     },
@@ -259,7 +410,7 @@ def build_openapi_30_schema() -> Dict[str, Any]:
                         },
                         "num_simulations": {"type": "integer", "default": 10000, "minimum": 100, "maximum": 100000, "description": "Number of simulation iterations."},
                         "time_horizon_days": {"type": "integer", "nullable": True, "minimum": 1, "maximum": 730, "description": "Filter to deals closing within N days."},
-                        "revenue_targets": {"type": "array", "items": {"type": "number"}, "nullable": True, "description": "Revenue targets to compute hit probabilities for."},
+                        "revenue_targets": {"type": "array", "items": {"type": "number", "minimum": 0.0, "exclusiveMinimum": True}, "maxItems": 20, "nullable": True, "description": "Revenue targets to compute hit probabilities for."},
                     },
                 },
                 "SummaryStatistics": {
@@ -322,7 +473,6 @@ def build_openapi_30_schema() -> Dict[str, Any]:
                     "properties": {
                         "status": {"type": "string"},
                         "version": {"type": "string"},
-                        "timestamp": {"type": "string", "format": "date-time"},
                     },
                 },
                 "ErrorResponse": {
@@ -336,14 +486,9 @@ def build_openapi_30_schema() -> Dict[str, Any]:
     }
 
 
-# ─── Local Dev Entry Point ─────────────────────────────────────────────────────
-if __name__ == "__main__":
-    import uvicorn
+# Pre-serialized schema body served by get_schema() — no per-request encoding.
+# It can only change on redeploy, so proxies and Salesforce may cache it for a day.
+_SCHEMA_BYTES = orjson.dumps(build_openapi_30_schema())
+_SCHEMA_ETAG = f'"{hashlib.md5(_SCHEMA_BYTES, usedforsecurity=False).hexdigest()}"'
+_SCHEMA_HEADERS = {"ETag": _SCHEMA_ETAG, "Cache-Control": "public, max-age=86400"}
 
-    uvicorn.run(
-        "main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=settings.debug,
-        log_level="debug" if settings.debug else "info",
-    )
@@ -7,12 +7,34 @@
 #
 # For Salesforce External Services, these models also drive the generated
 # OpenAPI spec — so clean models = clean schema = easier External Service setup.
+#
+# COLD STARTS:
+#   Every model sets defer_build=True, so pydantic-core schemas are not built
+#   at import time. main.py rebuilds API_MODELS in its startup lifespan so the
+#   first real request doesn't pay for it either. Field descriptions and
+#   examples are only attached in DEBUG (see _field below).
 # =============================================================================
 
-from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, confloat, conlist
+from typing import Any, List, Optional
 from datetime import date, datetime
 
+from config import settings
+
+
+def _field(**kwargs: Any) -> Any:
+    """
+    Field() that drops `description`/`examples` outside DEBUG.
+
+    That text only feeds FastAPI's /docs page, which is DEBUG-only (see
+    main.py) — Salesforce reads the hand-crafted 3.0 schema instead. Leaving
+    it off keeps FieldInfo and the schema pydantic builds smaller in prod.
+    """
+    if not settings.debug:
+        kwargs.pop("description", None)
+        kwargs.pop("examples", None)
+    return Field(**kwargs)
+
 
 # ─── Input Models ─────────────────────────────────────────────────────────────
 
@@ -25,35 +47,35 @@ class Opportunity(BaseModel):
     contact data — only statistical inputs needed for forecasting.
     """
 
-    name: str = Field(
+    # Unknown keys (e.g. Salesforce's "attributes"/"Id") are ignored — that's
+    # pydantic's default, so only the four fields below are ever read.
+    model_config = ConfigDict(defer_build=True)
+
+    name: str = _field(
         description="Opportunity name or identifier. Used only for tracking — not in computation.",
         max_length=255,
         examples=["Q1 Enterprise Deal - Acme Corp"]
     )
-    amount: float = Field(
-        description="Expected deal value in USD. Must be positive.",
+    # Bounds are enforced by pydantic-core (Rust), not a Python validator.
+    # The $10B cap guards against data-entry errors — a single deal that large
+    # is almost certainly a typo.
+    amount: float = _field(
+        description="Expected deal value in USD. Must be positive and at most $10B.",
         gt=0,
+        le=10_000_000_000,
         examples=[250000.0]
     )
-    probability: float = Field(
+    probability: float = _field(
         description="Win probability as a decimal between 0.0 and 1.0. Maps to Salesforce Opportunity.Probability / 100.",
         ge=0.0,
         le=1.0,
         examples=[0.75]
     )
-    close_date: date = Field(
+    close_date: date = _field(
         description="Expected close date (YYYY-MM-DD). Used to filter by time_horizon_days.",
         examples=["2025-03-31"]
     )
 
-    @field_validator("amount")
-    @classmethod
-    def amount_must_be_reasonable(cls, v: float) -> float:
-        """Guard against obviously bad data — a single deal over $10B is likely a data entry error."""
-        if v > 10_000_000_000:
-            raise ValueError("Amount exceeds $10B — please verify this is correct.")
-        return round(v, 2)
-
 
 class SimulationRequest(BaseModel):
     """
@@ -64,38 +86,32 @@ class SimulationRequest(BaseModel):
     the Apex class, which translates natural language intent into this struct.
     """
 
-    opportunities: List[Opportunity] = Field(
-        description="List of open opportunities to include in the simulation.",
-        min_length=1,
-        max_length=500
+    model_config = ConfigDict(defer_build=True)
+
+    # Length bounds live in the type, so pydantic-core rejects an oversized
+    # list before building any Opportunity instances.
+    opportunities: conlist(Opportunity, min_length=1, max_length=500) = _field(
+        description="List of open opportunities to include in the simulation (1–500).",
     )
-    num_simulations: int = Field(
+    num_simulations: int = _field(
         default=10_000,
         description="Number of Monte Carlo iterations to run. More = more accurate, slower. 10,000 is a good default.",
         ge=100,
         le=100_000
     )
-    time_horizon_days: Optional[int] = Field(
+    time_horizon_days: Optional[int] = _field(
         default=None,
         description="If set, only include opportunities with close_date within this many days from today.",
         ge=1,
         le=730,
         examples=[90]
     )
-    revenue_targets: Optional[List[float]] = Field(
+    revenue_targets: Optional[conlist(confloat(gt=0), max_length=20)] = _field(
         default=None,
-        description="Revenue amounts to calculate hit-probability for. Defaults to [1M, 5M, 10M, 25M, 50M].",
+        description="Up to 20 revenue amounts to calculate hit-probability for. Each must be positive. Defaults to [1M, 5M, 10M, 25M, 50M].",
         examples=[[5_000_000, 10_000_000, 20_000_000]]
     )
 
-    @model_validator(mode="after")
-    def validate_targets_are_positive(self) -> "SimulationRequest":
-        if self.revenue_targets:
-            for t in self.revenue_targets:
-                if t <= 0:
-                    raise ValueError(f"Revenue target must be positive, got: {t}")
-        return self
-
 
 # ─── Output Models ────────────────────────────────────────────────────────────
 
@@ -107,25 +123,29 @@ class SummaryStatistics(BaseModel):
     "Your expected revenue is $8.2M, but there's meaningful upside to $12M."
     """
 
-    mean: float = Field(description="Average (expected) total revenue across all simulations.")
-    median: float = Field(description="Middle value — half of simulations landed above, half below.")
-    std_dev: float = Field(description="Standard deviation — measures spread/uncertainty in the forecast.")
-    p10: float = Field(description="10th percentile — pessimistic scenario (only 10% of outcomes were lower).")
-    p25: float = Field(description="25th percentile — conservative scenario.")
-    p75: float = Field(description="75th percentile — optimistic scenario.")
-    p90: float = Field(description="90th percentile — very optimistic scenario (only 10% of outcomes were higher).")
-    min_outcome: float = Field(description="Worst-case result across all simulations.")
-    max_outcome: float = Field(description="Best-case result across all simulations.")
-    total_pipeline_value: float = Field(description="Sum of all opportunity amounts (100% win rate scenario).")
-    weighted_pipeline_value: float = Field(description="Sum of (amount × probability) for each opportunity — the 'expected value' without simulation.")
+    model_config = ConfigDict(defer_build=True)
+
+    mean: float = _field(description="Average (expected) total revenue across all simulations.")
+    median: float = _field(description="Middle value — half of simulations landed above, half below.")
+    std_dev: float = _field(description="Standard deviation — measures spread/uncertainty in the forecast.")
+    p10: float = _field(description="10th percentile — pessimistic scenario (only 10% of outcomes were lower).")
+    p25: float = _field(description="25th percentile — conservative scenario.")
+    p75: float = _field(description="75th percentile — optimistic scenario.")
+    p90: float = _field(description="90th percentile — very optimistic scenario (only 10% of outcomes were higher).")
+    min_outcome: float = _field(description="Worst-case result across all simulations.")
+    max_outcome: float = _field(description="Best-case result across all simulations.")
+    total_pipeline_value: float = _field(description="Sum of all opportunity amounts (100% win rate scenario).")
+    weighted_pipeline_value: float = _field(description="Sum of (amount × probability) for each opportunity — the 'expected value' without simulation.")
 
 
 class TargetAnalysis(BaseModel):
     """Probability of achieving a specific revenue target."""
 
-    target: float = Field(description="The revenue target in USD.")
-    probability: float = Field(description="Fraction of simulations that met or exceeded this target (0.0–1.0).")
-    probability_pct: str = Field(description="Human-readable probability, e.g. '72.4%'. Ready for the Agent to speak aloud.")
+    model_config = ConfigDict(defer_build=True)
+
+    target: float = _field(description="The revenue target in USD.")
+    probability: float = _field(description="Fraction of simulations that met or exceeded this target (0.0–1.0).")
+    probability_pct: str = _field(description="Human-readable probability, e.g. '72.4%'. Ready for the Agent to speak aloud.")
 
 
 class HistogramBucket(BaseModel):
@@ -136,20 +156,24 @@ class HistogramBucket(BaseModel):
     distribution — useful in a Slack canvas or Einstein Analytics dashboard.
     """
 
-    range_low: float = Field(description="Lower bound of this bucket (inclusive).")
-    range_high: float = Field(description="Upper bound of this bucket (exclusive).")
-    label: str = Field(description="Human-readable range label, e.g. '$8M – $9M'.")
-    count: int = Field(description="Number of simulation runs that fell in this range.")
-    frequency: float = Field(description="Fraction of runs in this bucket (count / num_simulations).")
+    model_config = ConfigDict(defer_build=True)
+
+    range_low: float = _field(description="Lower bound of this bucket (inclusive).")
+    range_high: float = _field(description="Upper bound of this bucket (exclusive).")
+    label: str = _field(description="Human-readable range label, e.g. '$8M – $9M'.")
+    count: int = _field(description="Number of simulation runs that fell in this range.")
+    frequency: float = _field(description="Fraction of runs in this bucket (count / num_simulations).")
 
 
 class SimulationMetadata(BaseModel):
     """Operational metadata about the simulation run itself."""
 
+    model_config = ConfigDict(defer_build=True)
+
     num_simulations: int
     opportunities_included: int
     opportunities_filtered_out: int
-    compute_time_ms: float = Field(description="Wall-clock time for the simulation in milliseconds.")
+    compute_time_ms: float = _field(description="Wall-clock time for the simulation in milliseconds.")
     timestamp: datetime
     time_horizon_days: Optional[int]
     api_version: str = "1.0.0"
@@ -167,6 +191,8 @@ class SimulationResponse(BaseModel):
      of $7.2M to $11.8M.'
     """
 
+    model_config = ConfigDict(defer_build=True)
+
     summary_statistics: SummaryStatistics
     target_analysis: List[TargetAnalysis]
     histogram_buckets: List[HistogramBucket]
@@ -176,6 +202,24 @@ class SimulationResponse(BaseModel):
 class HealthResponse(BaseModel):
     """Simple health check — used by load balancers and the Salesforce Named Credential test."""
 
+    model_config = ConfigDict(defer_build=True)
+
     status: str = "ok"
     version: str
-    timestamp: datetime
+
+
+# Validates a raw /simulate body (bytes) in one pass — see simulate() in main.py
+SIMULATION_REQUEST_ADAPTER: TypeAdapter[SimulationRequest] = TypeAdapter(SimulationRequest)
+
+
+# Models built in main.py's startup lifespan (see COLD STARTS note above)
+API_MODELS = (
+    Opportunity,
+    SimulationRequest,
+    SummaryStatistics,
+    TargetAnalysis,
+    HistogramBucket,
+    SimulationMetadata,
+    SimulationResponse,
+    HealthResponse,
+)
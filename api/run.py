@@ -0,0 +1,23 @@
+# =============================================================================
+# run.py — Local dev entry point
+#
+# Starts the API with uvicorn:
+#   cd api && python run.py
+#
+# Kept separate from main.py so that importing the app (gunicorn workers,
+# Mangum on Lambda, tests) never pulls uvicorn and its dependencies into the
+# import graph. Production servers import `main:app` directly.
+# =============================================================================
+
+import uvicorn
+
+from config import settings
+
+if __name__ == "__main__":
+    uvicorn.run(
+        "main:app",
+        host=settings.host,
+        port=settings.port,
+        reload=settings.debug,
+        log_level="debug" if settings.debug else "info",
+    )
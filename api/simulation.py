@@ -20,8 +20,10 @@
 
 import numpy as np
 import time
+from dataclasses import dataclass
 from datetime import date, datetime, timezone
-from typing import List, Optional
+from operator import attrgetter
+from typing import List, Optional, Sequence
 
 from models import (
     Opportunity,
@@ -32,6 +34,108 @@ from models import (
     SimulationResponse,
 )
 from config import settings
+from simulation_kernel import KERNEL_ENABLED, run_kernel
+
+# One generator per process, created at import and reused by every request —
+# NumPy's legacy global RandomState is slower and locks on every call.
+_RNG = np.random.default_rng()
+
+# Default targets as an array once, instead of converting the settings tuple
+# on every request that doesn't send its own targets.
+_DEFAULT_TARGETS = np.asarray(settings.default_revenue_targets, dtype=np.float64)
+
+# Above this many per-deal draws (num_simulations × n_deals), sample outcomes
+# from the exact revenue distribution instead of drawing every deal in every
+# run — see _exact_outcome_pmf().
+_EXACT_PATH_MIN_DRAWS = 2_000_000
+
+# Largest exact distribution (in amount-quantum bins) ever built — a memory
+# ceiling; the cost check below usually rejects far smaller PMFs first.
+_EXACT_PATH_MAX_BINS = 1 << 22
+
+# Building the PMF costs about bins × log2(bins) per pairwise round
+# (~2.5 ns each), a dense draw about 3.5 ns. The exact path is used only when
+# that estimate is at most this fraction of num_simulations × n_deals, so it
+# is clearly cheaper — at the default 10,000 simulations, 500 whole-dollar
+# deals (~4M bins) would take ~2 s to convolve vs ~20 ms to simulate.
+_EXACT_PATH_MAX_WORK_PER_DRAW = 0.5
+
+# Above this many per-deal draws, use the compiled kernel (when _mc_ext or
+# numba is available and there's more than one core) instead of the NumPy
+# block loop. Below it, the kernel's thread start-up isn't worth it.
+_COMPILED_KERNEL_MIN_DRAWS = 1_000_000
+
+# The dense path works through the simulations in row blocks whose float32
+# draws fit in ~128 KB (L2-resident), reusing one scratch buffer. Peak memory
+# is O(block × n_deals) instead of O(num_simulations × n_deals).
+_BLOCK_BYTES = 128 * 1024
+
+# Below this length, np.convolve beats an FFT round-trip.
+_DIRECT_CONVOLVE_MAX_LEN = 64
+
+# Quantiles read off the sorted outcomes: min, p10, p25, median, p75, p90,
+# max. q=0 and q=1 are exactly min and max.
+_SUMMARY_QUANTILES = np.array([0.0, 0.10, 0.25, 0.50, 0.75, 0.90, 1.0])
+
+# FFT round-off leaves ~1e-17 noise in bins no combination of deals can reach;
+# anything this small is zeroed so it can never be sampled.
+_PMF_NOISE_FLOOR = 1e-14
+
+
+def warm_up() -> None:
+    """
+    Pay one-time NumPy costs before the first real request.
+
+    Called from main.py's startup lifespan: the first draw forces the bit
+    generator's lazy state allocation, and a one-deal, one-run simulation
+    goes through the dense path (float32 draw, compare, np.dot) once.
+    """
+    _RNG.random(1)
+    run_monte_carlo(np.ones(1), np.full(1, 0.5), num_simulations=1)
+    # First kernel call starts its thread pool (and, for numba, JIT-compiles
+    # or loads the on-disk cache); no-op when the kernel isn't enabled
+    run_kernel(np.ones(1), np.ones(1), 1, seed=0)
+
+
+@dataclass(frozen=True)
+class OppArrays:
+    """
+    The simulation inputs of an opportunity list as parallel arrays.
+
+    Element i of each array belongs to opportunity i. run_full_simulation
+    builds this once per request; filtering, simulation, and statistics all
+    work on the arrays instead of walking the Opportunity objects again.
+    """
+
+    amounts: np.ndarray              # float64, shape (n_deals,)
+    probabilities: np.ndarray        # float64, shape (n_deals,)
+    close_date_ordinals: np.ndarray  # int64 date.toordinal(), shape (n_deals,)
+
+    @classmethod
+    def from_opportunities(cls, opportunities: List[Opportunity]) -> "OppArrays":
+        # np.fromiter with a known count fills each array directly — no
+        # intermediate Python list
+        n_deals = len(opportunities)
+        return cls(
+            amounts=np.fromiter(map(attrgetter("amount"), opportunities), np.float64, n_deals),
+            probabilities=np.fromiter(map(attrgetter("probability"), opportunities), np.float64, n_deals),
+            close_date_ordinals=np.fromiter(
+                map(date.toordinal, map(attrgetter("close_date"), opportunities)), np.int64, n_deals
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    def select(self, mask: np.ndarray) -> "OppArrays":
+        """The opportunities where mask is True."""
+        return OppArrays(self.amounts[mask], self.probabilities[mask], self.close_date_ordinals[mask])
+
+
+def _horizon_mask(close_date_ordinals: np.ndarray, time_horizon_days: int) -> np.ndarray:
+    """True where the close date is between today and today + time_horizon_days."""
+    today = date.today().toordinal()
+    return (close_date_ordinals >= today) & (close_date_ordinals <= today + time_horizon_days)
 
 
 def filter_opportunities_by_horizon(
@@ -43,22 +147,84 @@ def filter_opportunities_by_horizon(
 
     Returns (filtered_list, count_removed).
     If time_horizon_days is None, all opportunities pass through.
+
+    Same rule as run_full_simulation, which applies _horizon_mask to its
+    OppArrays directly — this is for callers that want the list back.
     """
     if time_horizon_days is None:
         return opportunities, 0
 
-    cutoff = date.today()
-    from datetime import timedelta
-    horizon_date = cutoff + timedelta(days=time_horizon_days)
-
-    included = [o for o in opportunities if cutoff <= o.close_date <= horizon_date]
+    ordinals = np.fromiter(
+        map(date.toordinal, map(attrgetter("close_date"), opportunities)), np.int64, len(opportunities)
+    )
+    keep = np.flatnonzero(_horizon_mask(ordinals, time_horizon_days))
+    included = [opportunities[i] for i in keep.tolist()]
     excluded_count = len(opportunities) - len(included)
     return included, excluded_count
 
 
+def _convolve(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Linear convolution of two PMFs — direct for short inputs, FFT otherwise."""
+    if min(len(a), len(b)) <= _DIRECT_CONVOLVE_MAX_LEN:
+        return np.convolve(a, b)
+    n = len(a) + len(b) - 1
+    n_fft = 1 << (n - 1).bit_length()  # next power of two
+    return np.fft.irfft(np.fft.rfft(a, n_fft) * np.fft.rfft(b, n_fft), n_fft)[:n]
+
+
+def _exact_outcome_pmf(
+    amounts: np.ndarray,
+    probabilities: np.ndarray,
+    max_work: float = np.inf,
+) -> Optional[tuple[np.ndarray, int]]:
+    """
+    Exact distribution of total won revenue (a Poisson-binomial sum).
+
+    Amounts are quantized to whole cents and divided by their GCD (the
+    "quantum"), so every possible total is an integer number of quanta. Each
+    deal is a two-point PMF — 1-p at 0, p at its amount — and the total's PMF
+    is their convolution, done pairwise so the work is log2(n_deals) rounds.
+
+    Returns (pmf, quantum_cents) where pmf[k] = P(revenue = k × quantum), or
+    None when the PMF would exceed _EXACT_PATH_MAX_BINS (e.g. amounts with
+    arbitrary cents make the quantum 1¢ and the PMF enormous) or its
+    estimated convolution work, bins × log2(bins) × rounds, exceeds max_work.
+    """
+    cents = np.rint(amounts * 100).astype(np.int64)
+    quantum = int(np.gcd.reduce(cents))
+    if quantum == 0:
+        return None
+    steps = cents // quantum
+    num_bins = int(steps.sum()) + 1
+    if num_bins > _EXACT_PATH_MAX_BINS:
+        return None
+    num_rounds = max(1, (len(steps) - 1).bit_length())  # ceil(log2(n_deals))
+    if num_bins * np.log2(num_bins) * num_rounds > max_work:
+        return None
+
+    pmfs = []
+    for step, p in zip(steps.tolist(), probabilities.tolist()):
+        pmf = np.zeros(step + 1)
+        pmf[0] = 1.0 - p
+        pmf[step] += p
+        pmfs.append(pmf)
+
+    while len(pmfs) > 1:
+        pairs = [_convolve(pmfs[i], pmfs[i + 1]) for i in range(0, len(pmfs) - 1, 2)]
+        if len(pmfs) % 2:
+            pairs.append(pmfs[-1])
+        pmfs = pairs
+
+    pmf = pmfs[0]
+    pmf[pmf < _PMF_NOISE_FLOOR] = 0.0
+    return pmf, quantum
+
+
 def run_monte_carlo(
-    opportunities: List[Opportunity],
+    amounts: np.ndarray,
+    probabilities: np.ndarray,
     num_simulations: int,
+    seed: Optional[int] = None,
 ) -> np.ndarray:
     """
     Core simulation: run N independent revenue scenarios and return results.
@@ -69,58 +235,168 @@ def run_monte_carlo(
       3. Sum all won amounts → one revenue scenario
     Repeat N times using NumPy's vectorized operations.
 
+    amounts and probabilities are float64 arrays of shape (n_deals,) — see
+    OppArrays. Pass a seed for a reproducible run (tests, backtests);
+    by default the shared process-wide generator is used.
+
     Returns a 1D numpy array of shape (num_simulations,) with revenue totals.
     """
-    if not opportunities:
-        return np.zeros(num_simulations)
+    # Deals at 100% are won in every run and deals at 0% in none, so neither
+    # needs a random draw. Only the uncertain deals are simulated, and the
+    # certain revenue is added to every run as a constant.
+    certain = probabilities >= 1.0
+    uncertain = (probabilities > 0.0) & ~certain
+    base_revenue = float(amounts[certain].sum())
+
+    if uncertain.any():
+        revenue_per_run = _simulate_uncertain(
+            amounts[uncertain], probabilities[uncertain], num_simulations, seed
+        )
+    else:
+        revenue_per_run = np.zeros(num_simulations)
+
+    if base_revenue:
+        revenue_per_run += base_revenue
+    return revenue_per_run
 
-    # Build arrays for vectorized math — one element per opportunity
-    amounts = np.array([o.amount for o in opportunities], dtype=np.float64)        # shape: (n_deals,)
-    probabilities = np.array([o.probability for o in opportunities], dtype=np.float64)  # shape: (n_deals,)
 
-    # Generate all random numbers at once: shape (num_simulations, n_deals)
-    # Each row = one simulation run; each column = one deal's random draw
-    random_draws = np.random.uniform(0, 1, size=(num_simulations, len(opportunities)))
+def _simulate_uncertain(
+    amounts: np.ndarray,
+    probabilities: np.ndarray,
+    num_simulations: int,
+    seed: Optional[int],
+) -> np.ndarray:
+    """run_monte_carlo() for deals with 0 < probability < 1."""
+    n_deals = len(amounts)
+    rng = _RNG if seed is None else np.random.default_rng(seed)
+
+    # Large runs: draw each simulation's total directly from the exact
+    # distribution (inverse-CDF sampling) — no (num_simulations × n_deals)
+    # matrix at all. Same distribution as the dense path below; taken only
+    # when building the distribution is clearly cheaper than the draws.
+    num_draws = num_simulations * n_deals
+    if num_draws > _EXACT_PATH_MIN_DRAWS:
+        exact = _exact_outcome_pmf(
+            amounts, probabilities, max_work=num_draws * _EXACT_PATH_MAX_WORK_PER_DRAW
+        )
+        if exact is not None:
+            pmf, quantum = exact
+            cdf = np.cumsum(pmf)
+            cdf /= cdf[-1]
+            bins = np.searchsorted(cdf, rng.random(num_simulations), side="right")
+            return (bins * quantum) / 100.0
+
+    # Amounts as whole cents, still float64: every partial sum is an integer
+    # below 2^53, so each run's total is exact to the cent (as on the exact
+    # path above) and one division at the end turns it back into dollars.
+    # Both the compiled kernel and the block loop below sum these.
+    amount_cents = np.rint(amounts * 100.0)
+
+    # Compiled kernel: one fused draw-compare-accumulate loop per run,
+    # parallel across cores, no intermediate matrix (see simulation_kernel.py).
+    # Kernels use their own RNG streams, so seeded runs stay on NumPy and
+    # reproduce the same outcomes whichever kernel a deployment has.
+    if seed is None and KERNEL_ENABLED and num_draws > _COMPILED_KERNEL_MIN_DRAWS:
+        revenue_per_run = run_kernel(amount_cents, probabilities, num_simulations, int(rng.integers(1 << 63)))
+        revenue_per_run /= 100.0
+        return revenue_per_run
+
+    block_rows = min(num_simulations, max(1, _BLOCK_BYTES // (n_deals * 4)))
+    probabilities_f32 = probabilities.astype(np.float32)
+
+    # Scratch buffer reused by every block: shape (block_rows, n_deals)
+    # Each row = one simulation run; each column = one deal's random draw.
+    # float32 halves the memory traffic; a win/loss comparison doesn't need
+    # float64 resolution.
+    random_draws = np.empty((block_rows, n_deals), dtype=np.float32)
+    revenue_per_run = np.empty(num_simulations)  # shape: (num_simulations,)
+
+    for start in range(0, num_simulations, block_rows):
+        stop = min(start + block_rows, num_simulations)
+        draws = random_draws[: stop - start]
+        rng.random(out=draws, dtype=np.float32)
+
+        # Won matrix: True where random draw < probability (deal is won)
+        # Broadcasting: probabilities shape (n_deals,) broadcasts across rows
+        won_matrix = draws < probabilities_f32
+
+        # For each simulation, sum the amounts of won deals as one matrix-vector
+        # product: won (0/1) @ cents. Both operands are C-contiguous float64,
+        # so np.dot goes straight to BLAS dgemv and writes into this block's
+        # slice of the result — no temporary. An int64 product would be just
+        # as exact but has no BLAS kernel; float32 would drift by dollars.
+        np.dot(won_matrix.astype(np.float64), amount_cents, out=revenue_per_run[start:stop])
+
+    revenue_per_run /= 100.0
+    return revenue_per_run
 
-    # Won matrix: True where random draw < probability (deal is won)
-    # Broadcasting: probabilities shape (n_deals,) broadcasts across rows
-    won_matrix = random_draws < probabilities  # shape: (num_simulations, n_deals)
 
-    # For each simulation, sum the amounts of won deals
-    # won_matrix * amounts: element-wise multiply (won=1×amount, lost=0×amount)
-    # .sum(axis=1): sum across deals for each simulation run
-    revenue_per_run = (won_matrix * amounts).sum(axis=1)  # shape: (num_simulations,)
+def _sorted_quantiles(sorted_values: np.ndarray, quantiles: np.ndarray) -> np.ndarray:
+    """
+    np.quantile(values, quantiles) for values that are already sorted.
 
-    return revenue_per_run
+    Same "linear" method, evaluated the way NumPy does so the results are
+    bit-identical — but the order statistics are read by index, with no
+    partitioning pass.
+    """
+    n = len(sorted_values)
+    virtual_index = (n - 1) * quantiles
+    below = np.floor(virtual_index).astype(np.intp)
+    above = np.minimum(below + 1, n - 1)
+    t = virtual_index - below
+    a = sorted_values[below]
+    b = sorted_values[above]
+    diff = b - a
+    return np.where(t >= 0.5, b - diff * (1 - t), a + diff * t)
 
 
 def compute_summary_statistics(
-    outcomes: np.ndarray,
-    opportunities: List[Opportunity],
+    sorted_outcomes: np.ndarray,
+    amounts: np.ndarray,
+    probabilities: np.ndarray,
 ) -> SummaryStatistics:
-    """Compute descriptive statistics from the simulation outcome distribution."""
+    """
+    Compute descriptive statistics from the simulation outcome distribution.
+
+    sorted_outcomes must be in ascending order (run_full_simulation sorts
+    once and shares the array with compute_target_analysis).
+    """
 
-    total_pipeline = sum(o.amount for o in opportunities)
-    weighted_pipeline = sum(o.amount * o.probability for o in opportunities)
+    total_pipeline = float(amounts.sum())
+    weighted_pipeline = float(amounts @ probabilities)
+
+    min_outcome, p10, p25, median, p75, p90, max_outcome = _sorted_quantiles(
+        sorted_outcomes, _SUMMARY_QUANTILES
+    ).tolist()
 
     return SummaryStatistics(
-        mean=float(np.mean(outcomes)),
-        median=float(np.median(outcomes)),
-        std_dev=float(np.std(outcomes)),
-        p10=float(np.percentile(outcomes, 10)),
-        p25=float(np.percentile(outcomes, 25)),
-        p75=float(np.percentile(outcomes, 75)),
-        p90=float(np.percentile(outcomes, 90)),
-        min_outcome=float(np.min(outcomes)),
-        max_outcome=float(np.max(outcomes)),
+        mean=float(np.mean(sorted_outcomes)),
+        median=median,
+        std_dev=float(np.std(sorted_outcomes)),
+        p10=p10,
+        p25=p25,
+        p75=p75,
+        p90=p90,
+        min_outcome=min_outcome,
+        max_outcome=max_outcome,
         total_pipeline_value=round(total_pipeline, 2),
         weighted_pipeline_value=round(weighted_pipeline, 2),
     )
 
 
+def _format_money(v: float) -> str:
+    """Compact dollar label using an appropriate scale, e.g. "$8.2M", "$450K"."""
+    if v >= 1_000_000:
+        return f"${v / 1_000_000:.1f}M"
+    elif v >= 1_000:
+        return f"${v / 1_000:.0f}K"
+    else:
+        return f"${v:,.0f}"
+
+
 def compute_target_analysis(
-    outcomes: np.ndarray,
-    targets: List[float],
+    sorted_outcomes: np.ndarray,
+    targets: Sequence[float],
     num_simulations: int,
 ) -> List[TargetAnalysis]:
     """
@@ -128,26 +404,31 @@ def compute_target_analysis(
 
     Example: if 7,200 out of 10,000 runs exceeded $10M, that's a 72.0% probability.
     This is the key number the Agentforce Agent surfaces conversationally.
+
+    sorted_outcomes must be in ascending order: every run from the first one
+    >= target onward hit it, so each target is a binary search, not a scan.
     """
-    results = []
-    for target in sorted(targets):
-        hit_count = int(np.sum(outcomes >= target))
-        probability = hit_count / num_simulations
-
-        # Format target as a human-readable label (e.g., "$10.0M")
-        if target >= 1_000_000:
-            target_label = f"${target / 1_000_000:.1f}M"
-        elif target >= 1_000:
-            target_label = f"${target / 1_000:.0f}K"
-        else:
-            target_label = f"${target:,.0f}"
-
-        results.append(TargetAnalysis(
-            target=round(target, 2),
-            probability=round(probability, 4),
+    sorted_targets = np.sort(np.asarray(targets, dtype=np.float64))
+    # All targets in one vectorized search; only model construction is per-target
+    hit_counts = len(sorted_outcomes) - np.searchsorted(sorted_outcomes, sorted_targets, side="left")
+    probabilities = hit_counts / num_simulations
+
+    # Rounded as arrays and converted in one .tolist() each, as in
+    # compute_histogram. The percentage label formats the unrounded value.
+    rounded_targets = np.round(sorted_targets, 2).tolist()
+    rounded_probabilities = np.round(probabilities, 4).tolist()
+
+    # Computed values, already the right types — no validation needed
+    return [
+        TargetAnalysis.model_construct(
+            target=target,
+            probability=rounded_probability,
             probability_pct=f"{probability * 100:.1f}%",
-        ))
-    return results
+        )
+        for target, rounded_probability, probability in zip(
+            rounded_targets, rounded_probabilities, probabilities.tolist()
+        )
+    ]
 
 
 def compute_histogram(
@@ -160,33 +441,52 @@ def compute_histogram(
     Returns a list of buckets with counts and frequencies — ready to
     feed into a chart library or display in Slack as a text histogram.
     """
-    counts, bin_edges = np.histogram(outcomes, bins=num_buckets)
     num_simulations = len(outcomes)
-    buckets = []
-
-    for i in range(len(counts)):
-        low = float(bin_edges[i])
-        high = float(bin_edges[i + 1])
-        count = int(counts[i])
-
-        # Format bucket label using appropriate scale
-        def fmt(v: float) -> str:
-            if v >= 1_000_000:
-                return f"${v / 1_000_000:.1f}M"
-            elif v >= 1_000:
-                return f"${v / 1_000:.0f}K"
-            else:
-                return f"${v:,.0f}"
-
-        buckets.append(HistogramBucket(
-            range_low=round(low, 2),
-            range_high=round(high, 2),
-            label=f"{fmt(low)} – {fmt(high)}",
+    lo = float(outcomes.min()) if num_simulations else 0.0
+    hi = float(outcomes.max()) if num_simulations else 0.0
+
+    if hi > lo:
+        # Equal-width bins, so each outcome's bucket is plain arithmetic —
+        # one scaled cast and a bincount, instead of np.histogram's general
+        # edge search. The max lands exactly on num_buckets; clip folds it
+        # into the last (closed) bucket, as np.histogram does.
+        bin_edges = np.linspace(lo, hi, num_buckets + 1)
+        bucket_index = ((outcomes - lo) * (num_buckets / (hi - lo))).astype(np.intp)
+        np.clip(bucket_index, 0, num_buckets - 1, out=bucket_index)
+        # Outcomes are sums of deal amounts, so they often sit exactly on an
+        # edge, where the scaled cast can round to the neighbouring bucket.
+        # Check against the edges themselves and step by one, as np.histogram
+        # does, so each bucket stays [low, high).
+        bucket_index[outcomes < bin_edges[bucket_index]] -= 1
+        bucket_index[(outcomes >= bin_edges[bucket_index + 1]) & (bucket_index != num_buckets - 1)] += 1
+        counts = np.bincount(bucket_index, minlength=num_buckets)
+    else:
+        # Every run had the same revenue (or there were none) — let
+        # np.histogram pick its default ±0.5 range around the single value
+        counts, bin_edges = np.histogram(outcomes, bins=num_buckets)
+    inv_num_simulations = 1.0 / num_simulations if num_simulations > 0 else 0.0
+
+    # Per-bucket numbers computed as arrays, then converted to Python values
+    # in one .tolist() each. Each edge is shared by two buckets, so it's
+    # rounded and labelled once.
+    edges = np.round(bin_edges, 2).tolist()
+    edge_labels = [_format_money(v) for v in bin_edges.tolist()]
+    frequencies = np.round(counts * inv_num_simulations, 4).tolist()
+
+    # model_construct skips validation — every value here was computed above
+    # and already has the field's type.
+    return [
+        HistogramBucket.model_construct(
+            range_low=low,
+            range_high=high,
+            label=f"{low_label} – {high_label}",
             count=count,
-            frequency=round(count / num_simulations, 4) if num_simulations > 0 else 0.0,
-        ))
-
-    return buckets
+            frequency=frequency,
+        )
+        for low, high, low_label, high_label, count, frequency in zip(
+            edges[:-1], edges[1:], edge_labels[:-1], edge_labels[1:], counts.tolist(), frequencies
+        )
+    ]
 
 
 def run_full_simulation(
@@ -200,41 +500,53 @@ def run_full_simulation(
 
     This is the single entry point called by the FastAPI route handler.
     Steps:
-      1. Filter opportunities by time horizon
+      1. Convert opportunities to arrays (the only pass over the list) and
+         filter by time horizon
       2. Run Monte Carlo iterations
       3. Compute statistics, target probabilities, histogram
       4. Wrap in metadata and return
+
+    Everything after step 1 takes the (amounts, probabilities) arrays — no
+    downstream function walks the Opportunity objects again.
     """
     start_time = time.perf_counter()
 
-    # Step 1: Filter by time horizon
-    filtered_opps, excluded_count = filter_opportunities_by_horizon(
-        opportunities, time_horizon_days
-    )
+    # Step 1: Convert to arrays once, then filter by time horizon with a mask
+    opp_arrays = OppArrays.from_opportunities(opportunities)
+    if time_horizon_days is not None:
+        opp_arrays = opp_arrays.select(_horizon_mask(opp_arrays.close_date_ordinals, time_horizon_days))
+    excluded_count = len(opportunities) - len(opp_arrays)
 
     # Step 2: Determine revenue targets
-    targets = revenue_targets if revenue_targets else settings.default_revenue_targets
+    targets = revenue_targets if revenue_targets else _DEFAULT_TARGETS
 
     # Step 3: Run simulation
-    outcomes = run_monte_carlo(filtered_opps, num_simulations)
+    outcomes = run_monte_carlo(opp_arrays.amounts, opp_arrays.probabilities, num_simulations)
+    # Sorted in place once and shared: summary statistics read quantiles by
+    # index, target analysis binary-searches, the histogram doesn't care
+    outcomes.sort()
 
     # Step 4: Compute all derived statistics
-    summary_stats = compute_summary_statistics(outcomes, filtered_opps)
+    summary_stats = compute_summary_statistics(outcomes, opp_arrays.amounts, opp_arrays.probabilities)
     target_analysis = compute_target_analysis(outcomes, targets, num_simulations)
     histogram = compute_histogram(outcomes)
 
-    # Step 5: Build metadata
+    # compute_time_ms covers filtering, simulation, and statistics — the
+    # clock stops before the response models are assembled
     elapsed_ms = (time.perf_counter() - start_time) * 1000
+
+    # Step 5: Build metadata
     metadata = SimulationMetadata(
         num_simulations=num_simulations,
-        opportunities_included=len(filtered_opps),
+        opportunities_included=len(opp_arrays),
         opportunities_filtered_out=excluded_count,
         compute_time_ms=round(elapsed_ms, 2),
         timestamp=datetime.now(timezone.utc),
         time_horizon_days=time_horizon_days,
     )
 
-    return SimulationResponse(
+    # Every part is an already-built model instance
+    return SimulationResponse.model_construct(
         summary_statistics=summary_stats,
         target_analysis=target_analysis,
         histogram_buckets=histogram,
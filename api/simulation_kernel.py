@@ -0,0 +1,108 @@
+# =============================================================================
+# simulation_kernel.py — Optional compiled Monte Carlo kernel
+#
+# The NumPy path in simulation.py has to materialize a block of random draws
+# and a won/lost matrix before it can sum anything. A compiled loop doesn't:
+# each simulation draws, compares, and accumulates in registers, and the
+# simulations run in parallel across all cores. No intermediate matrix at all.
+#
+# OPTIONAL DEPENDENCIES — the first one available wins:
+#   1. _mc_ext — ahead-of-time Cython/OpenMP build of _mc_ext.pyx. No JIT
+#      warm-up and no runtime dependency once built:
+#        cd api && pip install cython && python build_ext.py build_ext --inplace
+#   2. numba — JIT-compiled on first use; adds ~150 MB to the image:
+#        pip install numba
+#   With neither (or with only one core), simulation.py falls back to the
+#   pure-NumPy path. Results are statistically identical either way.
+#
+# THREADING:
+#   /simulate runs in Starlette's threadpool, so the kernel is launched from
+#   worker threads. Numba's "workqueue" layer aborts the process on concurrent
+#   launches, and TBB can hang at interpreter exit when first started off the
+#   main thread — so OpenMP is preferred, and calls go through run_kernel(),
+#   which serializes them. Each call already uses every core, so queueing a
+#   second large run behind the first costs nothing in throughput.
+# =============================================================================
+
+import threading
+from typing import Optional
+
+import numpy as np
+
+try:
+    import _mc_ext  # built from _mc_ext.pyx — see build_ext.py
+except ImportError:
+    _mc_ext = None
+
+numba = None
+if _mc_ext is None:
+    try:
+        import numba
+    except ImportError:  # pragma: no cover — exercised only without numba
+        pass
+    else:
+        # Must be set before the first parallel launch (see THREADING above)
+        numba.config.THREADING_LAYER_PRIORITY = ["omp", "tbb", "workqueue"]
+
+_KERNEL_LOCK = threading.Lock()
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def mc_kernel(
+        amounts: np.ndarray,
+        probabilities: np.ndarray,
+        num_simulations: int,
+    ) -> np.ndarray:
+        """
+        Revenue total for each of num_simulations runs.
+
+        Same math as the NumPy path: deal j is won in a run when a uniform
+        draw lands below probabilities[j]. prange splits the runs across
+        threads; Numba gives each thread its own independent random stream.
+        """
+        n_deals = amounts.shape[0]
+        out = np.empty(num_simulations)
+        for i in numba.prange(num_simulations):
+            acc = 0.0
+            for j in range(n_deals):
+                if np.random.random() < probabilities[j]:
+                    acc += amounts[j]
+            out[i] = acc
+        return out
+
+else:
+    mc_kernel = None
+
+# Which kernel run_kernel() dispatches to, and how many threads it gets
+if _mc_ext is not None:
+    KERNEL_NAME, _KERNEL_THREADS = "cython", _mc_ext.max_threads()
+elif numba is not None:
+    KERNEL_NAME, _KERNEL_THREADS = "numba", numba.config.NUMBA_NUM_THREADS
+else:
+    KERNEL_NAME, _KERNEL_THREADS = None, 0
+
+# On a single core there's nothing to parallelize, and NumPy's bulk float32
+# draws keep up with either kernel — leave it off there.
+KERNEL_ENABLED = _KERNEL_THREADS > 1
+
+
+def run_kernel(
+    amounts: np.ndarray,
+    probabilities: np.ndarray,
+    num_simulations: int,
+    seed: int,
+) -> Optional[np.ndarray]:
+    """
+    The selected kernel, serialized across threads; None when it's not enabled.
+
+    seed feeds the Cython kernel's per-simulation streams. Numba's per-thread
+    streams can't be seeded from here, so it ignores it.
+    """
+    if not KERNEL_ENABLED:
+        return None
+    with _KERNEL_LOCK:
+        if _mc_ext is not None:
+            return _mc_ext.mc_inner(amounts, probabilities, num_simulations, seed)
+        return mc_kernel(amounts, probabilities, num_simulations)
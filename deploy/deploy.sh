@@ -103,7 +103,6 @@ deploy_heroku() {
     if curl -sf "${APP_URL}/health" > /dev/null; then
         success "Deployment successful! Service running at ${APP_URL}"
         success "Health check: ${APP_URL}/health"
-        success "API docs:     ${APP_URL}/docs"
         success "Schema URL:   ${APP_URL}/api/v1/schema  ← Use this in Salesforce External Services"
     else
         warn "App deployed but health check not yet responding. Check: heroku logs --app ${APP_NAME} --tail"
@@ -0,0 +1,244 @@
+# =============================================================================
+# test_api.py — HTTP-level tests for the FastAPI service
+#
+# These tests exercise the routes the way Salesforce does: over HTTP, through
+# FastAPI's TestClient. They cover response shape and headers — the simulation
+# math itself is covered in test_simulation.py.
+#
+# RUN TESTS:
+#   cd api && pip install pytest httpx && pytest ../tests/ -v
+# =============================================================================
+
+import json
+import sys
+import os
+import re
+
+# Add the api/ directory to the Python path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "api"))
+
+import pytest
+from datetime import date, timedelta
+from fastapi.testclient import TestClient
+
+from main import CORS_OPTIONS, SalesforceCORSMiddleware, app, build_openapi_30_schema
+from models import API_MODELS
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def simulate_payload():
+    """A payload shaped like the one MonteCarloActionHandler.cls builds."""
+    today = date.today()
+    return {
+        "opportunities": [
+            {"name": "Deal A", "amount": 1_000_000, "probability": 0.9, "close_date": str(today + timedelta(days=30))},
+            {"name": "Deal B", "amount": 500_000, "probability": 0.5, "close_date": str(today + timedelta(days=60))},
+        ],
+        "num_simulations": 1000,
+        "revenue_targets": [1_000_000, 1_500_000],
+    }
+
+
+# ─── Test: Startup ────────────────────────────────────────────────────────────
+
+class TestStartup:
+
+    def test_lifespan_builds_deferred_models(self):
+        """Models defer schema build at import; startup must complete them."""
+        with TestClient(app):
+            assert all(model.__pydantic_complete__ for model in API_MODELS)
+
+    def test_lifespan_loads_simulation_engine(self):
+        """A started worker has NumPy and the RNG ready before the first /simulate."""
+        with TestClient(app):
+            assert "simulation" in sys.modules
+
+
+# ─── Test: OpenAPI 3.0 Schema Endpoint ────────────────────────────────────────
+
+class TestSchemaEndpoint:
+
+    def test_schema_is_openapi_30(self, client):
+        """Salesforce External Services only accepts OpenAPI 3.0."""
+        response = client.get("/api/v1/schema")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/json")
+        assert response.json()["openapi"].startswith("3.0")
+
+    def test_schema_matches_builder(self, client):
+        """The pre-serialized body must round-trip to the builder's dict."""
+        response = client.get("/api/v1/schema")
+        assert response.json() == build_openapi_30_schema()
+
+    def test_schema_has_cache_headers(self, client):
+        response = client.get("/api/v1/schema")
+        assert response.headers["etag"]
+        assert "max-age" in response.headers["cache-control"]
+
+    def test_schema_not_modified(self, client):
+        """A matching If-None-Match gets an empty 304 instead of the full schema."""
+        etag = client.get("/api/v1/schema").headers["etag"]
+        response = client.get("/api/v1/schema", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        response = client.get("/api/v1/schema", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize("if_none_match", ["W/{etag}", '"stale", W/{etag}', "*"])
+    def test_schema_not_modified_weak_comparison(self, client, if_none_match):
+        """If-None-Match uses weak comparison: W/ tags (from gzipping proxies) and * match too."""
+        etag = client.get("/api/v1/schema").headers["etag"]
+        response = client.get("/api/v1/schema", headers={"If-None-Match": if_none_match.format(etag=etag)})
+        assert response.status_code == 304
+
+    def test_schema_builder_is_cached(self):
+        """Settings are immutable at runtime, so the schema is built only once."""
+        assert build_openapi_30_schema() is build_openapi_30_schema()
+
+
+# ─── Test: Simulation Endpoint ────────────────────────────────────────────────
+
+class TestSimulateEndpoint:
+
+    def test_simulate_returns_forecast(self, client, simulate_payload):
+        response = client.post("/api/v1/simulate", json=simulate_payload)
+        assert response.status_code == 200
+        body = response.json()
+        assert set(body) == {"summary_statistics", "target_analysis", "histogram_buckets", "metadata"}
+        assert [t["target"] for t in body["target_analysis"]] == [1_000_000, 1_500_000]
+        assert body["metadata"]["num_simulations"] == 1000
+        assert body["metadata"]["opportunities_included"] == 2
+
+    def test_timestamp_is_utc_z(self, client, simulate_payload):
+        """The Apex handlers' fixtures parse timestamps in the "...Z" form."""
+        response = client.post("/api/v1/simulate", json=simulate_payload)
+        assert re.fullmatch(r"\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d(\.\d+)?Z", response.json()["metadata"]["timestamp"])
+
+    def test_invalid_payload_is_422(self, client, simulate_payload):
+        simulate_payload["opportunities"][0]["probability"] = 1.5
+        response = client.post("/api/v1/simulate", json=simulate_payload)
+        assert response.status_code == 422
+        assert "detail" in response.json()
+
+    def test_malformed_json_is_422(self, client):
+        """The raw-body path must report bad JSON the way FastAPI does."""
+        response = client.post(
+            "/api/v1/simulate", content=b"{not json", headers={"Content-Type": "application/json"}
+        )
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"][0] == "body"
+
+    def test_malformed_json_does_not_echo_body(self, client):
+        """On a JSON syntax error the input is the whole raw body — it's dropped."""
+        response = client.post(
+            "/api/v1/simulate", content=b"{bad" + b" " * 50_000, headers={"Content-Type": "application/json"}
+        )
+        error = response.json()["detail"][0]
+        assert error["type"] == "json_invalid"
+        assert error["loc"] == ["body"]
+        assert "input" not in error
+
+    def test_debug_docs_show_request_schema(self):
+        """With DEBUG=true the same raw-body handler runs, and /docs still gets its schema."""
+        import subprocess
+
+        api_dir = os.path.join(os.path.dirname(__file__), "..", "api")
+        script = (
+            "import json, main\n"
+            "from fastapi.testclient import TestClient\n"
+            "client = TestClient(main.app)\n"
+            "body = client.get('/openapi.json').json()['paths']['/api/v1/simulate']['post']['requestBody']\n"
+            "error = client.post('/api/v1/simulate', content=b'{bad').json()['detail'][0]\n"
+            "print(json.dumps([sorted(body['content']['application/json']['schema']['properties']), error['loc']]))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=api_dir,
+            env={**os.environ, "DEBUG": "true"},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        properties, loc = json.loads(result.stdout)
+        assert properties == ["num_simulations", "opportunities", "revenue_targets", "time_horizon_days"]
+        assert loc == ["body"]
+
+
+# ─── Test: CORS ───────────────────────────────────────────────────────────────
+
+class TestCors:
+    """
+    CORS is off by default (no DEBUG / ENABLE_CORS), so these tests build the
+    middleware from the same CORS_OPTIONS main.py would install.
+    """
+
+    @pytest.fixture
+    def cors(self):
+        return SalesforceCORSMiddleware(app, **CORS_OPTIONS)
+
+    def test_cors_disabled_by_default(self):
+        assert not any(m.cls is SalesforceCORSMiddleware for m in app.user_middleware)
+
+    @pytest.mark.parametrize("origin", [
+        "https://myorg.my.salesforce.com",
+        "https://myorg.lightning.force.com",
+        "https://myorg--sandbox.sandbox.my.salesforce.com",
+        "http://localhost:3000",
+    ])
+    def test_allowed_origins(self, cors, origin):
+        assert cors.is_allowed_origin(origin)
+
+    @pytest.mark.parametrize("origin", [
+        "https://evil.com",
+        "https://evil.com/fake.salesforce.com",
+        "https://salesforce.com.evil.com",
+        "https://salesforce.com",
+        "http://myorg.my.salesforce.com",
+    ])
+    def test_rejected_origins(self, cors, origin):
+        assert not cors.is_allowed_origin(origin)
+
+
+# ─── Test: Import Cost ────────────────────────────────────────────────────────
+
+class TestImportCost:
+
+    def test_main_does_not_import_numpy(self):
+        """Health checks shouldn't pay for NumPy — it loads on the first /simulate."""
+        import subprocess
+
+        api_dir = os.path.join(os.path.dirname(__file__), "..", "api")
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, main; print('numpy' in sys.modules)"],
+            cwd=api_dir,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False"
+
+
+# ─── Test: Built-in Docs ──────────────────────────────────────────────────────
+
+class TestBuiltinDocs:
+
+    def test_fastapi_docs_disabled_outside_debug(self, client):
+        """Only the hand-crafted 3.0 schema is served in production."""
+        for path in ("/docs", "/redoc", "/openapi.json"):
+            assert client.get(path).status_code == 404
+
+
+# ─── Test: Health Check ───────────────────────────────────────────────────────
+
+class TestHealthCheck:
+
+    def test_health_ok(self, client):
+        response = client.get("/health")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok", "version": app.version}
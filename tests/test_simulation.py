@@ -27,8 +27,13 @@ from datetime import date, timedelta
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "api"))
 
 import numpy as np
-from models import Opportunity, SimulationRequest
+from models import SIMULATION_REQUEST_ADAPTER, Opportunity, SimulationRequest
+import simulation
 from simulation import (
+    _exact_outcome_pmf,
+    _format_money,
+    _sorted_quantiles,
+    OppArrays,
     filter_opportunities_by_horizon,
     run_monte_carlo,
     compute_summary_statistics,
@@ -64,18 +69,24 @@ def impossible_opportunity():
     return [Opportunity(name="Impossible", amount=1_000_000, probability=0.0, close_date=date.today() + timedelta(days=30))]
 
 
+def as_arrays(opportunities):
+    """(amounts, probabilities) for calling the array-level functions directly."""
+    opp_arrays = OppArrays.from_opportunities(opportunities)
+    return opp_arrays.amounts, opp_arrays.probabilities
+
+
 # ─── Test: Monte Carlo Core Math ──────────────────────────────────────────────
 
 class TestMonteCarloMath:
 
     def test_certain_deal_always_won(self, certain_opportunity):
         """A 100% probability deal should always be won in every simulation."""
-        outcomes = run_monte_carlo(certain_opportunity, num_simulations=1000)
+        outcomes = run_monte_carlo(*as_arrays(certain_opportunity), num_simulations=1000)
         assert np.all(outcomes == 1_000_000), "100% probability deal should win every simulation"
 
     def test_impossible_deal_never_won(self, impossible_opportunity):
         """A 0% probability deal should never be won in any simulation."""
-        outcomes = run_monte_carlo(impossible_opportunity, num_simulations=1000)
+        outcomes = run_monte_carlo(*as_arrays(impossible_opportunity), num_simulations=1000)
         assert np.all(outcomes == 0), "0% probability deal should never win"
 
     def test_mean_converges_to_expected_value(self, sample_opportunities):
@@ -86,7 +97,7 @@ class TestMonteCarloMath:
         expected_value = sum(o.amount * o.probability for o in sample_opportunities)
         # 1M * 0.9 + 500K * 0.5 + 2M * 0.25 + 750K * 0.75 = 900K + 250K + 500K + 562.5K = 2.2125M
 
-        outcomes = run_monte_carlo(sample_opportunities, num_simulations=50_000)
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=50_000)
         simulated_mean = np.mean(outcomes)
 
         # Allow 2% tolerance — should be much tighter with 50K runs
@@ -99,54 +110,225 @@ class TestMonteCarloMath:
     def test_output_shape(self, sample_opportunities):
         """Output array should have exactly num_simulations elements."""
         num_sims = 5000
-        outcomes = run_monte_carlo(sample_opportunities, num_simulations=num_sims)
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=num_sims)
         assert len(outcomes) == num_sims, f"Expected {num_sims} outcomes, got {len(outcomes)}"
 
     def test_outcomes_are_non_negative(self, sample_opportunities):
         """Revenue can never be negative — a deal can only be won or lost, not reversed."""
-        outcomes = run_monte_carlo(sample_opportunities, num_simulations=1000)
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=1000)
         assert np.all(outcomes >= 0), "All revenue outcomes must be non-negative"
 
     def test_outcomes_bounded_by_total_pipeline(self, sample_opportunities):
         """Revenue can never exceed the sum of all deal amounts."""
         total = sum(o.amount for o in sample_opportunities)
-        outcomes = run_monte_carlo(sample_opportunities, num_simulations=1000)
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=1000)
         assert np.all(outcomes <= total + 0.01), f"Outcomes cannot exceed total pipeline ({total})"
 
+    def test_large_run_uses_exact_distribution(self, sample_opportunities):
+        """
+        Large runs sample from the exact outcome distribution. Every outcome
+        must be an achievable sum of deal amounts, and the mean must still
+        converge to the expected value.
+        """
+        amounts = [o.amount for o in sample_opportunities]
+        achievable = {
+            sum(a for a, won in zip(amounts, mask) if won)
+            for mask in np.ndindex(*(2,) * len(amounts))
+        }
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=600_000)
+
+        assert len(outcomes) == 600_000
+        assert set(np.unique(outcomes).tolist()) <= achievable
+        expected_value = sum(o.amount * o.probability for o in sample_opportunities)
+        assert abs(np.mean(outcomes) - expected_value) < expected_value * 0.01
+
+    def test_exact_path_skipped_when_pmf_costs_more_than_draws(self, monkeypatch):
+        """
+        500 whole-dollar deals at the default 10,000 runs: the PMF would have
+        ~4M bins and take seconds to convolve, vs ~20 ms of dense draws.
+        """
+        rng = np.random.default_rng(0)
+        amounts = rng.integers(1_000, 15_000, 500).astype(np.float64)
+        probabilities = rng.uniform(0.05, 0.95, 500)
+        max_work = 10_000 * 500 * simulation._EXACT_PATH_MAX_WORK_PER_DRAW
+        assert _exact_outcome_pmf(amounts, probabilities, max_work) is None
+
+        def fail(*args):
+            raise AssertionError("exact PMF built")
+
+        monkeypatch.setattr(simulation, "_convolve", fail)
+        outcomes = run_monte_carlo(amounts, probabilities, num_simulations=10_000)
+        assert len(outcomes) == 10_000
+
+    def test_exact_path_kept_when_pmf_is_cheap(self):
+        """500 deals in whole $1K: ~10K bins, far cheaper than 5M dense draws."""
+        rng = np.random.default_rng(0)
+        amounts = rng.integers(1, 40, 500) * 1_000.0
+        probabilities = rng.uniform(0.05, 0.95, 500)
+        max_work = 10_000 * 500 * simulation._EXACT_PATH_MAX_WORK_PER_DRAW
+        pmf, quantum = _exact_outcome_pmf(amounts, probabilities, max_work)
+        assert quantum == 100_000
+        assert abs(pmf.sum() - 1.0) < 1e-9
+
+    def test_certain_deals_added_to_every_run(self):
+        """100% deals add a constant, 0% deals nothing — only the rest are simulated."""
+        amounts = np.array([1_000_000.0, 2_000_000.0, 500_000.0])
+        probabilities = np.array([1.0, 0.0, 0.5])
+        outcomes = run_monte_carlo(amounts, probabilities, num_simulations=10_000)
+        assert set(np.unique(outcomes).tolist()) == {1_000_000.0, 1_500_000.0}
+        assert abs(np.mean(outcomes) - 1_250_000) < 1_250_000 * 0.02
+
+    def test_dense_totals_exact_to_the_cent(self):
+        """Totals are summed in cents, so 0.10 + 0.20 is 0.30, not 0.30000000000000004."""
+        amounts = np.array([0.10, 0.20])
+        probabilities = np.array([0.5, 0.5])
+        outcomes = run_monte_carlo(amounts, probabilities, num_simulations=1000, seed=7)
+        assert set(np.unique(outcomes).tolist()) == {0.0, 0.1, 0.2, 0.3}
+
+    @pytest.mark.parametrize("num_sims", [1000, 600_000])  # dense and exact paths
+    def test_seed_is_reproducible(self, sample_opportunities, num_sims):
+        amounts, probabilities = as_arrays(sample_opportunities)
+        first = run_monte_carlo(amounts, probabilities, num_simulations=num_sims, seed=42)
+        second = run_monte_carlo(amounts, probabilities, num_simulations=num_sims, seed=42)
+        other = run_monte_carlo(amounts, probabilities, num_simulations=num_sims, seed=43)
+        assert np.array_equal(first, second)
+        assert not np.array_equal(first, other)
+
+    def test_warm_up_runs_the_dense_path(self, monkeypatch):
+        """warm_up() must actually simulate, not return early on an empty pipeline."""
+        calls = []
+        real_simulate_uncertain = simulation._simulate_uncertain
+        monkeypatch.setattr(
+            simulation, "_simulate_uncertain", lambda *args: calls.append(args) or real_simulate_uncertain(*args)
+        )
+        simulation.warm_up()
+        assert len(calls) == 1
+
+    def test_opp_arrays(self, sample_opportunities):
+        opp_arrays = OppArrays.from_opportunities(sample_opportunities)
+        assert len(opp_arrays) == 4
+        assert opp_arrays.amounts.dtype == opp_arrays.probabilities.dtype == np.float64
+        assert opp_arrays.amounts.tolist() == [1_000_000, 500_000, 2_000_000, 750_000]
+        assert opp_arrays.probabilities.tolist() == [0.9, 0.5, 0.25, 0.75]
+        assert opp_arrays.close_date_ordinals.tolist() == [o.close_date.toordinal() for o in sample_opportunities]
+
+        selected = opp_arrays.select(opp_arrays.probabilities > 0.5)
+        assert selected.amounts.tolist() == [1_000_000, 750_000]
+        assert len(selected.close_date_ordinals) == 2
+
     def test_empty_opportunities_returns_zeros(self):
         """Empty opportunity list should return all-zero outcomes."""
-        outcomes = run_monte_carlo([], num_simulations=1000)
+        outcomes = run_monte_carlo(np.empty(0), np.empty(0), num_simulations=1000)
         assert np.all(outcomes == 0)
         assert len(outcomes) == 1000
 
 
+# ─── Test: Compiled Kernel (optional) ─────────────────────────────────────────
+
+class TestCompiledKernel:
+    """Each kernel only runs where it's available — both are optional."""
+
+    @pytest.fixture(params=["cython", "numba"])
+    def kernel(self, request):
+        if request.param == "cython":
+            _mc_ext = pytest.importorskip("_mc_ext", reason="_mc_ext not built")
+            return lambda amounts, probabilities, n: _mc_ext.mc_inner(amounts, probabilities, n, 12345)
+        from simulation_kernel import mc_kernel
+        if mc_kernel is None:
+            pytest.skip("numba not installed (or _mc_ext took precedence)")
+        return mc_kernel
+
+    def test_certain_and_impossible_deals(self, kernel):
+        outcomes = kernel(np.array([1_000_000.0, 500_000.0]), np.array([1.0, 0.0]), 1000)
+        assert np.all(outcomes == 1_000_000)
+
+    def test_mean_converges_to_expected_value(self, kernel, sample_opportunities):
+        amounts, probabilities = as_arrays(sample_opportunities)
+        outcomes = kernel(amounts, probabilities, 50_000)
+        expected_value = float(amounts @ probabilities)
+        assert len(outcomes) == 50_000
+        assert abs(np.mean(outcomes) - expected_value) < expected_value * 0.02
+
+    def test_run_monte_carlo_dispatches_to_kernel(self, sample_opportunities, monkeypatch):
+        """Large unseeded runs go through run_kernel() (forced on even on one core)."""
+        import simulation_kernel
+        if simulation_kernel.KERNEL_NAME is None:
+            pytest.skip("no compiled kernel available")
+        monkeypatch.setattr(simulation_kernel, "KERNEL_ENABLED", True)
+        monkeypatch.setattr(simulation, "KERNEL_ENABLED", True)
+        calls = []
+        real_run_kernel = simulation.run_kernel
+        monkeypatch.setattr(simulation, "run_kernel", lambda *args: calls.append(args) or real_run_kernel(*args))
+
+        amounts, probabilities = as_arrays(sample_opportunities)
+        outcomes = run_monte_carlo(amounts, probabilities, num_simulations=300_000)  # 1.2M draws
+        assert len(calls) == 1
+        expected_value = float(amounts @ probabilities)
+        assert abs(np.mean(outcomes) - expected_value) < expected_value * 0.01
+
+    def test_kernel_totals_exact_to_the_cent(self, monkeypatch):
+        """The kernels sum whole cents too, so 0.10 + 0.20 is 0.30."""
+        import simulation_kernel
+        if simulation_kernel.KERNEL_NAME is None:
+            pytest.skip("no compiled kernel available")
+        monkeypatch.setattr(simulation_kernel, "KERNEL_ENABLED", True)
+        monkeypatch.setattr(simulation, "KERNEL_ENABLED", True)
+        monkeypatch.setattr(simulation, "_EXACT_PATH_MIN_DRAWS", 1 << 62)
+
+        outcomes = run_monte_carlo(np.array([0.10, 0.20]), np.array([0.5, 0.5]), num_simulations=600_000)
+        assert set(np.unique(outcomes).tolist()) == {0.0, 0.1, 0.2, 0.3}
+
+    def test_cython_kernel_seed_is_reproducible(self, sample_opportunities):
+        _mc_ext = pytest.importorskip("_mc_ext", reason="_mc_ext not built")
+        amounts, probabilities = as_arrays(sample_opportunities)
+        first = _mc_ext.mc_inner(amounts, probabilities, 1001, 7)
+        assert len(first) == 1001
+        assert np.array_equal(first, _mc_ext.mc_inner(amounts, probabilities, 1001, 7))
+        assert not np.array_equal(first, _mc_ext.mc_inner(amounts, probabilities, 1001, 8))
+
+
 # ─── Test: Summary Statistics ─────────────────────────────────────────────────
 
 class TestSummaryStatistics:
 
     def test_percentiles_are_ordered(self, sample_opportunities):
         """Percentiles must be monotonically increasing: p10 ≤ p25 ≤ median ≤ p75 ≤ p90."""
-        outcomes = run_monte_carlo(sample_opportunities, num_simulations=10_000)
-        stats = compute_summary_statistics(outcomes, sample_opportunities)
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=10_000)
+        stats = compute_summary_statistics(np.sort(outcomes), *as_arrays(sample_opportunities))
 
         assert stats.p10 <= stats.p25 <= stats.median <= stats.p75 <= stats.p90, (
             f"Percentiles not ordered: p10={stats.p10}, p25={stats.p25}, "
             f"median={stats.median}, p75={stats.p75}, p90={stats.p90}"
         )
 
+    def test_quantiles_match_numpy(self, sample_opportunities):
+        """The batched quantile call must agree with the individual NumPy functions."""
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=10_000)
+        stats = compute_summary_statistics(np.sort(outcomes), *as_arrays(sample_opportunities))
+
+        assert stats.median == np.median(outcomes)
+        assert [stats.p10, stats.p25, stats.p75, stats.p90] == np.percentile(outcomes, [10, 25, 75, 90]).tolist()
+        assert (stats.min_outcome, stats.max_outcome) == (outcomes.min(), outcomes.max())
+
+    @pytest.mark.parametrize("n", [1, 2, 7, 10_000])
+    def test_sorted_quantiles_match_np_quantile(self, n):
+        values = np.sort(np.random.default_rng(n).random(n) * 1e7)
+        q = np.array([0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0])
+        assert np.array_equal(_sorted_quantiles(values, q), np.quantile(values, q))
+
     def test_min_max_bounds(self, sample_opportunities):
         """Min and max should be within [0, total_pipeline]."""
         total = sum(o.amount for o in sample_opportunities)
-        outcomes = run_monte_carlo(sample_opportunities, num_simulations=5_000)
-        stats = compute_summary_statistics(outcomes, sample_opportunities)
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=5_000)
+        stats = compute_summary_statistics(np.sort(outcomes), *as_arrays(sample_opportunities))
 
         assert stats.min_outcome >= 0
         assert stats.max_outcome <= total + 0.01
 
     def test_weighted_pipeline_calculation(self, sample_opportunities):
         """Weighted pipeline (sum of amount×prob) should match manual calculation."""
-        outcomes = run_monte_carlo(sample_opportunities, num_simulations=100)
-        stats = compute_summary_statistics(outcomes, sample_opportunities)
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=100)
+        stats = compute_summary_statistics(np.sort(outcomes), *as_arrays(sample_opportunities))
 
         expected_weighted = (
             1_000_000 * 0.9 +
@@ -158,8 +340,8 @@ class TestSummaryStatistics:
 
     def test_total_pipeline_calculation(self, sample_opportunities):
         """Total pipeline should equal sum of all amounts."""
-        outcomes = run_monte_carlo(sample_opportunities, num_simulations=100)
-        stats = compute_summary_statistics(outcomes, sample_opportunities)
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=100)
+        stats = compute_summary_statistics(np.sort(outcomes), *as_arrays(sample_opportunities))
         expected_total = 1_000_000 + 500_000 + 2_000_000 + 750_000
         assert abs(stats.total_pipeline_value - expected_total) < 0.01
 
@@ -170,38 +352,52 @@ class TestTargetAnalysis:
 
     def test_impossible_target_probability_near_zero(self, certain_opportunity):
         """Probability of hitting $10B from a $1M deal should be ~0%."""
-        outcomes = run_monte_carlo(certain_opportunity, num_simulations=1000)
-        results = compute_target_analysis(outcomes, [10_000_000_000], num_simulations=1000)
+        outcomes = run_monte_carlo(*as_arrays(certain_opportunity), num_simulations=1000)
+        results = compute_target_analysis(np.sort(outcomes), [10_000_000_000], num_simulations=1000)
         assert results[0].probability < 0.01
 
     def test_easy_target_probability_near_one(self, certain_opportunity):
         """Probability of hitting $0 revenue should be 100%."""
-        outcomes = run_monte_carlo(certain_opportunity, num_simulations=1000)
-        results = compute_target_analysis(outcomes, [0.01], num_simulations=1000)
+        outcomes = run_monte_carlo(*as_arrays(certain_opportunity), num_simulations=1000)
+        results = compute_target_analysis(np.sort(outcomes), [0.01], num_simulations=1000)
         assert results[0].probability > 0.99
 
     def test_targets_are_sorted(self, sample_opportunities):
         """Returned targets should be in ascending order."""
-        outcomes = run_monte_carlo(sample_opportunities, num_simulations=1000)
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=1000)
         results = compute_target_analysis(
-            outcomes, [5_000_000, 1_000_000, 2_000_000], num_simulations=1000
+            np.sort(outcomes), [5_000_000, 1_000_000, 2_000_000], num_simulations=1000
         )
         targets = [r.target for r in results]
         assert targets == sorted(targets), "Targets should be returned in ascending order"
 
+    def test_hit_counts_match_full_scan(self, sample_opportunities):
+        """Binary search on sorted outcomes must count exactly the runs >= target (ties included)."""
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=5_000)
+        targets = [1_000_000, 1_500_000, 2_250_000, 4_250_000]  # 1.5M and 2.25M are achievable sums
+        results = compute_target_analysis(np.sort(outcomes), targets, num_simulations=5_000)
+        for result, target in zip(results, targets):
+            assert result.probability == round(np.sum(outcomes >= target) / 5_000, 4)
+
+    def test_results_hold_native_types(self, sample_opportunities):
+        """Results skip validation, so they must be built from plain Python numbers."""
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=1000)
+        for result in compute_target_analysis(np.sort(outcomes), [1_000_000, 2_000_000], num_simulations=1000):
+            assert type(result.target) is float and type(result.probability) is float
+
     def test_probability_pct_format(self, sample_opportunities):
         """probability_pct should look like '72.4%'."""
-        outcomes = run_monte_carlo(sample_opportunities, num_simulations=1000)
-        results = compute_target_analysis(outcomes, [1_000_000], num_simulations=1000)
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=1000)
+        results = compute_target_analysis(np.sort(outcomes), [1_000_000], num_simulations=1000)
         pct_str = results[0].probability_pct
         assert pct_str.endswith("%")
         float(pct_str.rstrip("%"))  # Should be parseable as float — raises if not
 
     def test_probabilities_monotonically_decrease(self, sample_opportunities):
         """Higher revenue targets should have lower (or equal) hit probability."""
-        outcomes = run_monte_carlo(sample_opportunities, num_simulations=10_000)
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=10_000)
         results = compute_target_analysis(
-            outcomes, [500_000, 1_000_000, 2_000_000, 5_000_000], num_simulations=10_000
+            np.sort(outcomes), [500_000, 1_000_000, 2_000_000, 5_000_000], num_simulations=10_000
         )
         probs = [r.probability for r in results]
         for i in range(len(probs) - 1):
@@ -227,6 +423,18 @@ class TestTimeHorizonFilter:
         assert filtered[0].name == "Close Soon"
         assert excluded == 1
 
+    def test_filter_bounds_are_inclusive(self):
+        """Deals closing today and exactly on the horizon day are both kept."""
+        today = date.today()
+        opps = [
+            Opportunity(name="Today",    amount=100_000, probability=0.5, close_date=today),
+            Opportunity(name="Last Day", amount=100_000, probability=0.5, close_date=today + timedelta(days=90)),
+            Opportunity(name="Too Late", amount=100_000, probability=0.5, close_date=today + timedelta(days=91)),
+        ]
+        filtered, excluded = filter_opportunities_by_horizon(opps, time_horizon_days=90)
+        assert [o.name for o in filtered] == ["Today", "Last Day"]
+        assert excluded == 1
+
     def test_no_filter_returns_all(self, sample_opportunities):
         """None time_horizon_days should return all opportunities."""
         filtered, excluded = filter_opportunities_by_horizon(sample_opportunities, None)
@@ -250,7 +458,7 @@ class TestHistogram:
 
     def test_histogram_frequencies_sum_to_one(self, sample_opportunities):
         """All histogram bucket frequencies should sum to 1.0."""
-        outcomes = run_monte_carlo(sample_opportunities, num_simulations=10_000)
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=10_000)
         buckets = compute_histogram(outcomes, num_buckets=10)
         total_freq = sum(b.frequency for b in buckets)
         assert abs(total_freq - 1.0) < 0.001, f"Frequencies sum to {total_freq}, expected ~1.0"
@@ -258,11 +466,48 @@ class TestHistogram:
     def test_histogram_counts_sum_to_simulations(self, sample_opportunities):
         """All histogram bucket counts should sum to num_simulations."""
         num_sims = 5000
-        outcomes = run_monte_carlo(sample_opportunities, num_simulations=num_sims)
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=num_sims)
         buckets = compute_histogram(outcomes, num_buckets=10)
         total_count = sum(b.count for b in buckets)
         assert total_count == num_sims, f"Counts sum to {total_count}, expected {num_sims}"
 
+    @pytest.mark.parametrize("value, label", [
+        (12_345_678, "$12.3M"),
+        (450_000, "$450K"),
+        (999.4, "$999"),
+    ])
+    def test_money_labels(self, value, label):
+        assert _format_money(value) == label
+
+    def test_histogram_matches_numpy(self):
+        """
+        The bincount fast path must bucket like np.histogram. Outcomes are
+        multiples of $100K, as real pipelines produce, so many land exactly
+        on a bucket edge — where a bare scaled cast misplaces them.
+        """
+        rng = np.random.default_rng(7)
+        for _ in range(200):
+            amounts = rng.integers(1, 30, rng.integers(5, 40)) * 100_000.0
+            outcomes = run_monte_carlo(amounts, rng.uniform(0.1, 0.9, len(amounts)), num_simulations=2000)
+            counts, edges = np.histogram(outcomes, bins=12)
+            buckets = compute_histogram(outcomes, num_buckets=12)
+            assert [b.count for b in buckets] == counts.tolist()
+            assert [b.range_low for b in buckets] == np.round(edges[:-1], 2).tolist()
+
+    def test_histogram_buckets_hold_native_types(self, sample_opportunities):
+        """Buckets skip validation, so they must be built from plain Python numbers."""
+        outcomes = run_monte_carlo(*as_arrays(sample_opportunities), num_simulations=1000)
+        for bucket in compute_histogram(outcomes):
+            assert type(bucket.count) is int
+            assert all(type(v) is float for v in (bucket.range_low, bucket.range_high, bucket.frequency))
+
+    def test_histogram_single_value(self, certain_opportunity):
+        """When every run lands on the same revenue, all counts go in one bucket."""
+        outcomes = run_monte_carlo(*as_arrays(certain_opportunity), num_simulations=1000)
+        buckets = compute_histogram(outcomes, num_buckets=10)
+        assert len(buckets) == 10
+        assert sorted(b.count for b in buckets) == [0] * 9 + [1000]
+
 
 # ─── Test: Full Integration ───────────────────────────────────────────────────
 
@@ -320,7 +565,33 @@ class TestInputValidation:
         with pytest.raises(Exception):
             Opportunity(name="Bad", amount=-100, probability=0.5, close_date=date.today())
 
+    def test_opportunity_amount_capped_at_10b(self):
+        """A single deal over $10B is treated as a data-entry error."""
+        Opportunity(name="Max", amount=10_000_000_000, probability=0.5, close_date=date.today())
+        with pytest.raises(Exception):
+            Opportunity(name="Typo", amount=10_000_000_001, probability=0.5, close_date=date.today())
+
+    def test_revenue_targets_must_be_positive(self, sample_opportunities):
+        """Zero or negative targets should fail validation."""
+        with pytest.raises(Exception):
+            SimulationRequest(opportunities=sample_opportunities, revenue_targets=[1_000_000, 0])
+
+    def test_simulation_request_caps_opportunities_and_targets(self, sample_opportunities):
+        """More than 500 opportunities or 20 targets should fail validation."""
+        with pytest.raises(Exception):
+            SimulationRequest(opportunities=sample_opportunities * 126)
+        with pytest.raises(Exception):
+            SimulationRequest(opportunities=sample_opportunities, revenue_targets=list(range(1, 22)))
+
     def test_simulation_request_requires_opportunities(self):
         """Empty opportunities list should fail validation."""
         with pytest.raises(Exception):
             SimulationRequest(opportunities=[])
+
+    def test_opportunity_ignores_unknown_salesforce_fields(self):
+        """Extra SOQL fields (attributes, Id) are ignored (pydantic's default), not rejected."""
+        raw = b'{"opportunities": [{"name": "006x", "amount": 1000, "probability": 0.5, "close_date": "2030-01-31", "attributes": {"type": "Opportunity"}}]}'
+        opps = SIMULATION_REQUEST_ADAPTER.validate_json(raw).opportunities
+        assert len(opps) == 1
+        assert opps[0].amount == 1000
+        assert not hasattr(opps[0], "attributes")